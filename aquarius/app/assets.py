@@ -2,19 +2,21 @@
 # Copyright 2023 Ocean Protocol Foundation
 # SPDX-License-Identifier: Apache-2.0
 #
-import copy
 import elasticsearch
 from flask import Blueprint, jsonify, request
 from datetime import timedelta
+from functools import lru_cache
 import json
 import logging
 import os
 
 from aquarius.app.es_instance import ElasticsearchInstance
 from aquarius.app.util import (
+    encode_json,
     sanitize_record,
     sanitize_query_result,
     get_signature_vrs,
+    use_filter_context,
 )
 from aquarius.ddo_checker.shacl_checker import validate_dict
 from aquarius.log import setup_logging
@@ -31,6 +33,12 @@ logger = logging.getLogger("aquarius")
 es_instance = ElasticsearchInstance()
 
 
+def _json_response(data, status=200):
+    return app.response_class(
+        response=encode_json(data), status=status, mimetype="application/json"
+    )
+
+
 @assets.route("/ddo/<did>", methods=["GET"])
 def get_ddo(did):
     """Get DDO of a particular asset.
@@ -140,12 +148,7 @@ def get_ddo(did):
     """
     try:
         asset_record = es_instance.get(did)
-        response = app.response_class(
-            response=sanitize_record(asset_record),
-            status=200,
-            mimetype="application/json",
-        )
-        return response
+        return _json_response(sanitize_record(asset_record))
     except elasticsearch.exceptions.NotFoundError:
         return jsonify(error=f"Asset DID {did} not found in Elasticsearch."), 404
     except Exception as e:
@@ -194,13 +197,8 @@ def get_metadata(did):
         description: This asset DID is not in ES.
     """
     try:
-        asset_record = es_instance.get(did)
-        response = app.response_class(
-            response=sanitize_record(asset_record["metadata"]),
-            status=200,
-            mimetype="application/json",
-        )
-        return response
+        asset_record = es_instance.get(did, source_includes=["metadata", "status"])
+        return _json_response(sanitize_record(asset_record["metadata"]))
     except Exception as e:
         logger.error(f"get_metadata: {str(e)}")
         return (
@@ -258,11 +256,18 @@ def get_assets_names():
     if not isinstance(did_list, list):
         return jsonify(error="The didList must be a list."), 400
 
+    try:
+        asset_records = es_instance.get_many(
+            did_list, source_includes=["metadata.name", "status"]
+        )
+    except Exception as e:
+        logger.error(f"get_assets_names: {str(e)}")
+        asset_records = {}
+
     names = dict()
     for did in did_list:
         try:
-            asset_record = es_instance.get(did)
-            names[did] = asset_record["metadata"]["name"]
+            names[did] = asset_records[did]["metadata"]["name"]
         except Exception:
             names[did] = ""
 
@@ -293,11 +298,11 @@ def query_ddo():
         )
 
     try:
-        args = copy.deepcopy(data)
+        args = dict(data)
         if "from" in args.keys():
             args["from_"] = args.pop("from")
-        result = es_instance.es.search(**args)
-        return jsonify(sanitize_query_result(result.body))
+        result = es_instance.es.search(**use_filter_context(args))
+        return _json_response(sanitize_query_result(result.body))
     except elasticsearch.exceptions.TransportError as e:
         error = e.message
         logger.info(f"Received elasticsearch TransportError: {error}.")
@@ -371,14 +376,32 @@ def validate_remote():
         )
 
         if valid:
-            return jsonify(get_signature_vrs(raw))
+            return _json_response(get_signature_vrs(raw))
 
-        return (jsonify(errors=errors), 400)
+        return _json_response({"errors": errors}, 400)
     except Exception as e:
         logger.error(f"validate_remote failed: {str(e)}.")
         return jsonify(error=f"Encountered error when validating asset: {str(e)}."), 500
 
 
+@lru_cache(maxsize=64)
+def _get_retry_mechanism(chain_id):
+    """Builds the retry queue of a chain once, reusing its web3 connection."""
+    retries_db_index = f"{es_instance.db_index}_retries"
+    purgatory = (
+        Purgatory(es_instance)
+        if (os.getenv("ASSET_PURGATORY_URL") or os.getenv("ACCOUNT_PURGATORY_URL"))
+        else None
+    )
+
+    retry_mechanism = RetryMechanism(
+        es_instance, retries_db_index, purgatory, chain_id, None
+    )
+    retry_mechanism.retry_interval = timedelta(seconds=1)
+
+    return retry_mechanism
+
+
 @assets.route("/triggerCaching", methods=["POST"])
 def trigger_caching():
     """Triggers manual caching of a specific transaction (MetadataCreated or MetadataUpdated event)
@@ -425,21 +448,13 @@ def trigger_caching():
                 jsonify(error="Invalid transactionId or chain_id"),
                 400,
             )
+        try:
+            chain_id = int(chain_id)
+        except (TypeError, ValueError):
+            return jsonify(error="Invalid chain_id, must be an integer."), 400
         log_index = int(data.get("logIndex", 0))
 
-        es_instance = ElasticsearchInstance()
-        retries_db_index = f"{es_instance.db_index}_retries"
-        purgatory = (
-            Purgatory(es_instance)
-            if (os.getenv("ASSET_PURGATORY_URL") or os.getenv("ACCOUNT_PURGATORY_URL"))
-            else None
-        )
-
-        retry_mechanism = RetryMechanism(
-            es_instance, retries_db_index, purgatory, chain_id, None
-        )
-        retry_mechanism.retry_interval = timedelta(seconds=1)
-        retry_mechanism.add_tx_to_retry_queue(tx_id, log_index)
+        _get_retry_mechanism(chain_id).add_tx_to_retry_queue(tx_id, log_index)
         response = app.response_class(
             response="Queued",
             status=200,
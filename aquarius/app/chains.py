@@ -30,7 +30,7 @@ def get_chains_list():
         description: No chains are present
     """
     try:
-        chains = es_instance.es.get(index=f"{es_instance.db_index}_plus", id="chains")[
+        chains = es_instance.es.get(index=es_instance.other_db_index, id="chains")[
             "_source"
         ]
         return jsonify(chains)
@@ -62,7 +62,7 @@ def get_index_status(chain_id):
     """
     try:
         last_block_record = es_instance.es.get(
-            index=f"{es_instance.db_index}_plus",
+            index=es_instance.other_db_index,
             id="events_last_block_" + str(chain_id),
         )["_source"]
         return jsonify(last_block_record)
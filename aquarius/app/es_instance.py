@@ -6,8 +6,10 @@ import logging
 import os
 import time
 
-from elasticsearch import Elasticsearch
+from elasticsearch import Elasticsearch, helpers
 from elasticsearch.exceptions import NotFoundError
+from elasticsearch.serializer import JsonSerializer
+from aquarius.app.util import encode_json
 from aquarius.events.util import make_did
 
 _DB_INSTANCE = None
@@ -20,6 +22,17 @@ logging.getLogger("elastic_transport.node_pool").setLevel(logging.ERROR)
 logging.getLogger("elastic_transport.transport").setLevel(logging.ERROR)
 
 
+class OrjsonSerializer(JsonSerializer):
+    """Encodes requests of the elasticsearch client with orjson.
+
+    Responses are still decoded by the stdlib, since orjson turns integers
+    wider than 64 bits into floats and _source is returned as stored.
+    """
+
+    def json_dumps(self, data):
+        return encode_json(data, default=self.default)
+
+
 class ElasticsearchInstance(object):
     def __init__(self):
         args = {}
@@ -29,6 +42,7 @@ class ElasticsearchInstance(object):
         password = os.getenv("DB_PASSWORD", "changeme")
         args["http_auth"] = (username, password)
         args["maxsize"] = 1000
+        args["serializer"] = OrjsonSerializer()
         ssl = self.str_to_bool(os.getenv("DB_SSL", "false"))
         if ssl:
             args["verify_certs"] = self.str_to_bool(
@@ -40,7 +54,12 @@ class ElasticsearchInstance(object):
             args["ssl_show_warn"] = False
         index = os.getenv("DB_INDEX", "oceandb")
         self._index = index
+        self._other_index = f"{self._index}_plus"
         self._did_states_index = f"{self._index}_did_states"
+        try:
+            self._batch_size = int(os.getenv("DB_BATCH_SIZE", 1000))
+        except ValueError:
+            self._batch_size = 1000
         try:
             self._es = Elasticsearch(host + ":" + str(port), **args)
             while self._es.ping() is False:
@@ -61,6 +80,11 @@ class ElasticsearchInstance(object):
     def db_index(self):
         return self._index
 
+    @property
+    def other_db_index(self):
+        """Index of the bookkeeping records: chains list and last processed blocks."""
+        return self._other_index
+
     @staticmethod
     def str_to_bool(s):
         if s.lower() == "true":
@@ -92,13 +116,16 @@ class ElasticsearchInstance(object):
             refresh="wait_for",
         )["_id"]
 
-    def read(self, resource_id):
+    def read(self, resource_id, source_includes=None):
         """Read object in elasticsearch using the resource_id.
         :param resource_id: id of the object to be read.
+        :param source_includes: fields to be fetched, all of them if None.
         :return: object value from elasticsearch.
         """
         # logger.debug("elasticsearch::read::{}".format(resource_id))
-        return self.es.get(index=self.db_index, id=resource_id)["_source"]
+        return self.es.get(
+            index=self.db_index, id=resource_id, source_includes=source_includes
+        )["_source"]
 
     def exists(self, resource_id):
         """Check if document exists.
@@ -148,9 +175,9 @@ class ElasticsearchInstance(object):
 
         return 0
 
-    def get(self, asset_id):
+    def get(self, asset_id, source_includes=None):
         try:
-            asset = self.read(asset_id)
+            asset = self.read(asset_id, source_includes)
         except NotFoundError:
             logger.info(f"Asset with id {asset_id} was not found in ES.")
             raise
@@ -164,6 +191,37 @@ class ElasticsearchInstance(object):
 
         return asset
 
+    def get_many(self, asset_ids, source_includes=None):
+        """Fetch several assets in a single round trip.
+        :param asset_ids: ids of the assets to be read.
+        :param source_includes: fields to be fetched, all of them if None.
+        :return: dict of id to asset, for the assets found and listed.
+        """
+        docs = self.es.mget(
+            index=self.db_index, ids=asset_ids, source_includes=source_includes
+        )["docs"]
+
+        return {
+            doc["_id"]: doc["_source"]
+            for doc in docs
+            if doc.get("found") and self.is_listed(doc["_source"])
+        }
+
+    def scan(self, query, source_includes=None):
+        """Iterate over all the objects matching a query, fetched in batches.
+        :param query: elasticsearch query.
+        :param source_includes: fields to be fetched, all of them if None.
+        :return: generator of the matching objects.
+        """
+        for hit in helpers.scan(
+            self.es,
+            index=self.db_index,
+            query={"query": query},
+            size=self._batch_size,
+            source_includes=source_includes,
+        ):
+            yield hit["_source"]
+
     @staticmethod
     def is_listed(asset):
         if (
@@ -7,9 +7,11 @@ import logging
 import os
 
 from datetime import datetime
+from functools import lru_cache
 from hashlib import sha256
 from json import JSONDecodeError
 
+import orjson
 from eth_account import Account
 from eth_keys import KeyAPI
 from eth_keys.backends import NativeECCBackend
@@ -27,9 +29,9 @@ def sanitize_record(data_record):
         data_record.pop("_id")
 
     if not os.getenv("RBAC_SERVER_URL"):
-        return json.dumps(data_record, default=datetime_converter)
+        return data_record
 
-    return json.dumps(RBAC.sanitize_record(data_record))
+    return RBAC.sanitize_record(data_record)
 
 
 def sanitize_query_result(query_result):
@@ -39,6 +41,45 @@ def sanitize_query_result(query_result):
     return RBAC.sanitize_query_result(query_result)
 
 
+def sort_uses_score(sort):
+    """Checks whether an ES sort clause orders (or may order) hits by score."""
+    if not sort:
+        return True
+
+    for clause in sort if isinstance(sort, list) else [sort]:
+        if isinstance(clause, str):
+            fields = [field.split(":")[0].strip() for field in clause.split(",")]
+        else:
+            fields = clause
+        if "_score" in fields or "_script" in fields:
+            return True
+
+    return False
+
+
+def use_filter_context(query_args):
+    """Moves the query into filter context when relevance scores are not used,
+    so that Elasticsearch skips scoring and can cache the matching docs.
+    Aggregations and collapse are left alone, since top_hits and inner_hits
+    sort by score by default."""
+    score_args = [
+        "min_score",
+        "rescore",
+        "track_scores",
+        "aggs",
+        "aggregations",
+        "collapse",
+    ]
+    if (
+        "query" not in query_args
+        or any(k in query_args for k in score_args)
+        or sort_uses_score(query_args.get("sort"))
+    ):
+        return query_args
+
+    return {**query_args, "query": {"bool": {"filter": [query_args["query"]]}}}
+
+
 def get_bool_env_value(envvar_name, default_value=0):
     assert default_value in (0, 1), "bad default value, must be either 0 or 1"
     try:
@@ -52,6 +93,15 @@ def datetime_converter(o):
         return o.isoformat()
 
 
+def encode_json(data, default=datetime_converter):
+    """Serializes data to JSON bytes, ready to be used as a response body."""
+    try:
+        return orjson.dumps(data, default=default)
+    except orjson.JSONEncodeError:
+        # orjson refuses integers wider than 64 bits, stdlib json does not
+        return json.dumps(data, default=default, separators=(",", ":")).encode("utf-8")
+
+
 class AquariusPrivateKeyException(Exception):
     pass
 
@@ -61,15 +111,26 @@ def get_aquarius_wallet():
     if pk is None:
         raise AquariusPrivateKeyException("Missing Aquarius PRIVATE_KEY")
 
+    return _account_from_key(pk)
+
+
+@lru_cache(maxsize=1)
+def _account_from_key(pk):
+    """Derives the account of a private key, which costs an EC multiplication."""
     return Account.from_key(private_key=pk)
 
 
+@lru_cache(maxsize=1)
+def _signing_key(key_bytes):
+    return keys.PrivateKey(key_bytes)
+
+
 def get_signature_vrs(raw):
     try:
         hashed_raw = sha256(raw)
         wallet = get_aquarius_wallet()
 
-        keys_pk = keys.PrivateKey(wallet.key)
+        keys_pk = _signing_key(wallet.key)
 
         prefix = "\x19Ethereum Signed Message:\n32"
         signable_hash = Web3.solidity_keccak(
@@ -93,7 +154,7 @@ def get_signature_bytes(raw):
     try:
         wallet = get_aquarius_wallet()
 
-        keys_pk = keys.PrivateKey(wallet.key)
+        keys_pk = _signing_key(wallet.key)
         message_hash = Web3.solidity_keccak(
             ["bytes"],
             [Web3.to_bytes(text=raw)],
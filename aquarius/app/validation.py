@@ -3,14 +3,15 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 import logging
-from pathlib import Path
-import pkg_resources
-import rdflib
 
 from flask import Blueprint, jsonify, request
 
 from aquarius.ddo_checker.conversion import graph_to_dict
-from aquarius.ddo_checker.shacl_checker import CURRENT_VERSION, ALLOWED_VERSIONS
+from aquarius.ddo_checker.shacl_checker import (
+    CURRENT_VERSION,
+    ALLOWED_VERSIONS,
+    get_schema_graph,
+)
 
 from aquarius.log import setup_logging
 from aquarius.myapp import app
@@ -40,13 +41,7 @@ def schema():
         if version not in ALLOWED_VERSIONS:
             return jsonify(erorr="Schema version not found."), 404
 
-        path = "ddo_checker/shacl_schemas/v4/remote_" + version + ".ttl"
-        schema_file = Path(
-            pkg_resources.resource_filename("aquarius", path)
-        ).read_text()
-        rulesGraph = rdflib.Graph().parse(data=schema_file)
-
-        return graph_to_dict(rulesGraph), 200
+        return graph_to_dict(get_schema_graph(version)), 200
     except Exception as e:
         msg = f"Error in schema validation exposition: {str(e)}"
         logger.error(msg)
@@ -4,6 +4,7 @@
 #
 import copy
 from datetime import datetime
+from functools import lru_cache
 import json
 import logging
 import rdflib
@@ -32,6 +33,12 @@ def get_schema(version=CURRENT_VERSION):
     return schema_file.read_text()
 
 
+@lru_cache(maxsize=None)
+def get_schema_graph(version=CURRENT_VERSION):
+    """Gets the parsed shapes graph corresponding to the version, parsed only once."""
+    return rdflib.Graph().parse(data=get_schema(version), format="turtle")
+
+
 def parse_report_to_errors(results_graph):
     """Iterates throgh results graph to create a dictionary of key: validation message."""
     paths = [
@@ -103,10 +110,10 @@ def validate_dict(dict_orig, chain_id, nft_address):
     dictionary_as_string = json.dumps(dictionary)
 
     version = dictionary.get("version", CURRENT_VERSION)
-    schema_file = get_schema(version)
+    shapes_graph = get_schema_graph(version)
     dataGraph = rdflib.Graph().parse(data=dictionary_as_string, format="json-ld")
 
-    conforms, results_graph, _ = validate(dataGraph, shacl_graph=schema_file)
+    conforms, results_graph, _ = validate(dataGraph, shacl_graph=shapes_graph)
     errors = parse_report_to_errors(results_graph)
 
     if extra_errors:
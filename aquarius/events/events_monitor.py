@@ -67,7 +67,7 @@ class EventsMonitor(BlockProcessingClass):
     def __init__(self, web3):
         self._es_instance = ElasticsearchInstance()
 
-        self._other_db_index = f"{self._es_instance.db_index}_plus"
+        self._other_db_index = self._es_instance.other_db_index
         self._es_instance.es.indices.create(index=self._other_db_index, ignore=400)
 
         self._retries_db_index = f"{self._es_instance.db_index}_retries"
@@ -536,21 +536,9 @@ class EventsMonitor(BlockProcessingClass):
         self.store_last_processed_block(self._start_block)
 
     def get_assets_in_chain(self):
-        query = {"query_string": {"query": self._chain_id, "default_field": "chainId"}}
+        query = {"term": {"chainId": self._chain_id}}
 
-        page = self._es_instance.es.search(
-            index=self._es_instance.db_index, query=query
-        )
-        total = page["hits"]["total"]["value"]
-        page = self._es_instance.es.search(
-            index=self._es_instance.db_index, query=query, size=total
-        )
-
-        object_list = []
-        for x in page["hits"]["hits"]:
-            object_list.append(x["_source"])
-
-        return object_list
+        return list(self._es_instance.scan(query, source_includes=["id", "chainId"]))
 
     def get_and_process_event_logs_for_one_block(self, block):
         """Get events for one topic at a time from one block -> multiple rpc calls
@@ -68,26 +68,9 @@ class Purgatory:
         :return: List of assets authored by `account_address`
         """
         logger.info(f"PURGATORY: getting assets authored by {account_address}.")
-        query = {
-            "query_string": {
-                "query": account_address,
-                "default_field": "event.from",
-            }
-        }
-
-        page = self._es_instance.es.search(
-            index=self._es_instance.db_index, query=query
-        )
-        total = page["hits"]["total"]["value"]
-        page = self._es_instance.es.search(
-            index=self._es_instance.db_index, query=query, size=total
-        )
-
-        object_list = []
-        for x in page["hits"]["hits"]:
-            object_list.append(x["_source"])
+        query = {"match": {"event.from": account_address}}
 
-        return object_list
+        return list(self._es_instance.scan(query))
 
     def update_lists(self):
         """
@@ -6,7 +6,13 @@
 This module creates an instance of flask `app`.
 """
 from flask import Flask
+from flask_compress import Compress
 from flask_cors import CORS
 
 app = Flask(__name__)
+app.json.compact = True
+app.json.sort_keys = False
+app.config["COMPRESS_MIMETYPES"] = ["application/json"]
+app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
 CORS(app)
+Compress(app)
@@ -97,11 +97,10 @@ app.register_blueprint(validation, url_prefix=BaseURLs.VALIDATION_URL)
 @click.argument("block_number")
 def force_set_block(chain_id, block_number):
     index_name = "events_last_block_" + str(chain_id)
-    other_db_index = f"{es_instance.db_index}_plus"
     record = {"last_block": block_number}
 
     es_instance.es.index(
-        index=other_db_index,
+        index=es_instance.other_db_index,
         id=index_name,
         body=record,
         refresh="wait_for",
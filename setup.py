@@ -21,6 +21,7 @@ install_requirements = [
     "coloredlogs==15.0.1",
     "Flask==3.0.0",
     "Flask-Cors==4.0.0",
+    "Flask-Compress==1.14",
     "flask-swagger==0.2.14",
     "flask-swagger-ui==4.11.1",
     "Jinja2>=2.10.1",
@@ -36,6 +37,7 @@ install_requirements = [
     "pyshacl==0.22.2",
     "gql==3.4.1",
     "aiohttp==3.9.0",
+    "orjson==3.9.10",
 ]
 
 setup_requirements = ["pytest-runner==6.0.0"]
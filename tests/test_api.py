@@ -2,6 +2,7 @@
 # Copyright 2023 Ocean Protocol Foundation
 # SPDX-License-Identifier: Apache-2.0
 #
+import gzip
 import json
 
 from aquarius.run import get_status, get_version
@@ -29,6 +30,12 @@ def test_spec(client):
     assert "connected" in result["info"]
 
 
+def test_spec_compressed(client):
+    rv = client.get("/spec", headers={"Accept-Encoding": "gzip"})
+    assert rv.headers["Content-Encoding"] == "gzip"
+    assert "version" in json.loads(gzip.decompress(rv.data))["info"]
+
+
 def test_invalid_requests(client_with_no_data, base_ddo_url, query_url):
     response = run_request(client_with_no_data.post, query_url, "not a dict request")
     assert response.status == "400 BAD REQUEST"
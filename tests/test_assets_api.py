@@ -3,6 +3,7 @@
 # SPDX-License-Identifier: Apache-2.0
 #
 import json
+from unittest.mock import patch
 
 from aquarius.constants import BaseURLs
 from aquarius.events.constants import EventTypes
@@ -117,6 +118,42 @@ def test_get_assets_names(client, events_object):
         assert did_to_name[did], "did name not found."
 
 
+def test_get_assets_names_listing_status(client):
+    base_url = BaseURLs.BASE_AQUARIUS_URL + "/assets"
+    with patch("elasticsearch.Elasticsearch.mget") as mock:
+        mock.return_value = {
+            "docs": [
+                {
+                    "_id": "did:op:listed",
+                    "found": True,
+                    "_source": {"metadata": {"name": "Listed"}},
+                },
+                {
+                    "_id": "did:op:unlisted",
+                    "found": True,
+                    "_source": {
+                        "metadata": {"name": "Unlisted"},
+                        "status": {"isListed": False},
+                    },
+                },
+                {"_id": "did:op:missing", "found": False},
+            ]
+        }
+        did_to_name = run_request_get_data(
+            client.post,
+            base_url + "/names",
+            {"didList": ["did:op:listed", "did:op:unlisted", "did:op:missing"]},
+        )
+
+        assert did_to_name == {
+            "did:op:listed": "Listed",
+            "did:op:unlisted": "",
+            "did:op:missing": "",
+        }
+        mock.assert_called_once()
+        assert mock.call_args.kwargs["source_includes"] == ["metadata.name", "status"]
+
+
 def test_asset_metadata_not_found(client):
     result = run_request(client.get, "api/aquarius/assets/metadata/missing")
     assert result.status == "404 NOT FOUND"
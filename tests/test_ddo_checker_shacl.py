@@ -13,6 +13,7 @@ import pytest
 import rdflib
 
 from aquarius.ddo_checker.shacl_checker import (
+    get_schema_graph,
     validate_dict,
     parse_report_to_errors,
     CURRENT_VERSION,
@@ -89,6 +90,16 @@ def test_remote_ddo_passes():
     assert valid
 
 
+def test_schema_graph_is_parsed_once():
+    assert get_schema_graph(CURRENT_VERSION) is get_schema_graph(CURRENT_VERSION)
+    assert get_schema_graph("4.1.0") is not get_schema_graph(CURRENT_VERSION)
+
+    valid, _ = validate_dict(json_dict, json_dict["chainId"], json_dict["nftAddress"])
+    assert valid
+    valid, _ = validate_dict(json_dict, json_dict["chainId"], json_dict["nftAddress"])
+    assert valid
+
+
 def test_remote_ddo_fails():
     _copy = copy.deepcopy(json_dict)
     _copy.pop("@context")
@@ -2,11 +2,12 @@
 # Copyright 2023 Ocean Protocol Foundation
 # SPDX-License-Identifier: Apache-2.0
 #
+from datetime import datetime
 from unittest.mock import patch
 
 import pytest
 
-from aquarius.app.es_instance import ElasticsearchInstance
+from aquarius.app.es_instance import ElasticsearchInstance, OrjsonSerializer
 from aquarius.myapp import app
 
 es_instance = ElasticsearchInstance()
@@ -19,6 +20,21 @@ def test_str_to_bool():
         es_instance.str_to_bool("something_else")
 
 
+def test_orjson_serializer():
+    serializer = OrjsonSerializer()
+    created = datetime(2023, 1, 1, 12, 30)
+    body = {"id": "did:op:123", "created": created}
+
+    assert serializer.loads(serializer.dumps(body)) == {
+        "id": "did:op:123",
+        "created": "2023-01-01T12:30:00",
+    }
+    assert serializer.dumps({"amount": 2**70}) == b'{"amount":1180591620717411303424}'
+    assert serializer.loads(b'{"amount":1180591620717411303424}') == {"amount": 2**70}
+    assert serializer.dumps('{"already": "encoded"}') == b'{"already": "encoded"}'
+    assert serializer.loads(b"") is None
+
+
 def test_write_duplicate():
     with pytest.raises(ValueError):
         with patch("elasticsearch.Elasticsearch.exists") as mock:
@@ -64,6 +80,42 @@ def test_get():
         mock.return_value = None
         assert es_instance.get(1) is None
 
+    with patch("elasticsearch.Elasticsearch.get") as mock:
+        mock.return_value = {"_source": {"metadata": {"name": "test"}}}
+        asset = es_instance.get(1, source_includes=["metadata", "status"])
+        assert asset == {"metadata": {"name": "test"}}
+        assert mock.call_args.kwargs["source_includes"] == ["metadata", "status"]
+
+
+def test_get_many():
+    with patch("elasticsearch.Elasticsearch.mget") as mock:
+        mock.return_value = {
+            "docs": [
+                {"_id": "listed", "found": True, "_source": {"id": "listed"}},
+                {
+                    "_id": "unlisted",
+                    "found": True,
+                    "_source": {"status": {"isListed": False}},
+                },
+                {"_id": "missing", "found": False},
+            ]
+        }
+        assets = es_instance.get_many(["listed", "unlisted", "missing"])
+        assert assets == {"listed": {"id": "listed"}}
+        mock.assert_called_once()
+
+
+def test_scan():
+    with patch("elasticsearch.helpers.scan") as mock:
+        mock.return_value = iter([{"_source": {"id": "a"}}, {"_source": {"id": "b"}}])
+        query = {"match_all": {}}
+        assert list(es_instance.scan(query, source_includes=["id"])) == [
+            {"id": "a"},
+            {"id": "b"},
+        ]
+        assert mock.call_args.kwargs["query"] == {"query": query}
+        assert mock.call_args.kwargs["source_includes"] == ["id"]
+
 
 def test_is_listed():
     mock_asset = {"missing status": "test"}
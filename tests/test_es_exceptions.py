@@ -6,6 +6,7 @@ from unittest.mock import patch
 
 import elasticsearch
 
+from aquarius.app.assets import _get_retry_mechanism
 from aquarius.constants import BaseURLs
 from aquarius.run import get_status
 from tests.helpers import (
@@ -38,12 +39,36 @@ def test_get_metadata_exception(client):
 
 
 def test_get_assets_names_exception(client):
-    with patch("aquarius.app.es_instance.ElasticsearchInstance.get") as mock:
+    with patch("aquarius.app.es_instance.ElasticsearchInstance.get_many") as mock:
         mock.side_effect = Exception("Boom!")
         base_url = BaseURLs.BASE_AQUARIUS_URL + "/assets"
-        rv = run_request(client.post, base_url + "/names", {"didList": [1]})
-        # just skips the name
+        rv = run_request(
+            client.post, base_url + "/names", {"didList": ["did:op:1", "did:op:2"]}
+        )
+        # just skips the names
         assert rv.status_code == 200
+        assert rv.json == {"did:op:1": "", "did:op:2": ""}
+
+
+def test_trigger_caching_chain_id(client):
+    url = BaseURLs.BASE_AQUARIUS_URL + "/assets/triggerCaching"
+    rv = run_request(
+        client.post, url, {"transactionId": "0xaabbccdd", "chain_id": "not_an_int"}
+    )
+    assert rv.status_code == 400
+    assert rv.json["error"] == "Invalid chain_id, must be an integer."
+
+    _get_retry_mechanism.cache_clear()
+    with patch("aquarius.app.assets.RetryMechanism") as mock:
+        for chain_id in ["8996", 8996]:
+            rv = run_request(
+                client.post, url, {"transactionId": "0xaabbccdd", "chain_id": chain_id}
+            )
+            assert rv.status_code == 200
+
+        mock.assert_called_once()
+        assert mock.call_args.args[3] == 8996
+    _get_retry_mechanism.cache_clear()
 
 
 def test_transport_error(client, query_url):
@@ -15,12 +15,15 @@ import pytest
 from aquarius.app.auth_util import compare_eth_addresses
 from aquarius.app.util import (
     datetime_converter,
+    encode_json,
     get_bool_env_value,
     sanitize_record,
     sanitize_query_result,
     get_aquarius_wallet,
     AquariusPrivateKeyException,
     get_signature_vrs,
+    sort_uses_score,
+    use_filter_context,
 )
 from aquarius.block_utils import BlockProcessingClass
 from aquarius.events.http_provider import get_web3_connection_provider
@@ -107,9 +110,18 @@ def test_datetime_converter():
     assert datetime_converter(datetime.now())
 
 
+def test_encode_json():
+    now = datetime.now()
+    result = json.loads(encode_json({"created": now, "value": 1}))
+    assert result == {"created": now.isoformat(), "value": 1}
+
+    result = json.loads(encode_json({"amount": 2**70}))
+    assert result["amount"] == 2**70
+
+
 def test_sanitize_record():
     record = {"_id": "something", "other_value": "something else"}
-    result = json.loads(sanitize_record(record))
+    result = sanitize_record(record)
     assert "_id" not in result
     assert result["other_value"] == "something else"
 
@@ -123,7 +135,7 @@ def test_sanitize_record_through_rbac(monkeypatch):
         response.status_code = 200
         mock.return_value = response
 
-        result = json.loads(sanitize_record({}))
+        result = sanitize_record({})
         assert result["this_is"] == "SPARTAAA!"
 
     with patch("requests.post") as mock:
@@ -131,10 +143,48 @@ def test_sanitize_record_through_rbac(monkeypatch):
         response.status_code = 404
         mock.return_value = response
 
-        result = json.loads(sanitize_record({"this_is": "something else"}))
+        result = sanitize_record({"this_is": "something else"})
         assert result["this_is"] == "something else"
 
 
+def test_sort_uses_score():
+    assert sort_uses_score(None)
+    assert sort_uses_score([])
+    assert sort_uses_score("_score")
+    assert sort_uses_score([{"metadata.created": "desc"}, "_score"])
+    assert sort_uses_score({"_script": {"type": "number"}})
+    assert sort_uses_score("metadata.created:desc,_score:desc")
+    assert sort_uses_score(["metadata.created:desc, _score"])
+    assert not sort_uses_score("metadata.created:desc")
+    assert not sort_uses_score("metadata.created:desc,nft.name:asc")
+    assert not sort_uses_score([{"metadata.created": {"order": "desc"}}])
+
+
+def test_use_filter_context():
+    query = {"query_string": {"query": "-purgatory.state:true"}}
+    sort = {"metadata.created": "desc"}
+
+    args = use_filter_context({"query": query, "sort": sort, "size": 5})
+    assert args == {
+        "query": {"bool": {"filter": [query]}},
+        "sort": sort,
+        "size": 5,
+    }
+
+    for args in [
+        {"query": query},
+        {"query": query, "sort": "_score"},
+        {"query": query, "sort": sort, "min_score": 1},
+        {"query": query, "sort": sort, "track_scores": True},
+        {"query": query, "sort": "metadata.created:desc,_score:desc"},
+        {"query": query, "sort": sort, "aggs": {"top": {"top_hits": {}}}},
+        {"query": query, "sort": sort, "aggregations": {"top": {"top_hits": {}}}},
+        {"query": query, "sort": sort, "collapse": {"field": "nft.owner"}},
+        {"sort": sort},
+    ]:
+        assert use_filter_context(args) == args
+
+
 def test_sanitize_query_result(monkeypatch):
     result = sanitize_query_result({"this_is": "Athens, for some reason."})
     assert result["this_is"] == "Athens, for some reason."
@@ -238,6 +288,12 @@ def test_setup_logging(monkeypatch):
     setup_logging("some_madeup_path")
 
 
+def test_wallet_is_derived_once():
+    wallet = get_aquarius_wallet()
+    assert get_aquarius_wallet() is wallet
+    assert wallet.address == Account.from_key(os.environ["PRIVATE_KEY"]).address
+
+
 def test_wallet_missing(monkeypatch):
     monkeypatch.delenv("PRIVATE_KEY")
     with pytest.raises(AquariusPrivateKeyException):